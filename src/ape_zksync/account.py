@@ -1,8 +1,11 @@
 import json
+import os
 from copy import deepcopy
-from typing import Iterator, List, Optional
+from functools import lru_cache
+from typing import Iterator, List, Optional, Tuple
 
 from ape.api import AccountAPI, ReceiptAPI, TestAccountAPI, TestAccountContainerAPI, TransactionAPI
+from ape.contracts import ContractContainer, ContractInstance
 from ape.exceptions import AccountsError, SignatureError, TransactionError
 from ape.types import AddressType, MessageSignature, TransactionSignature
 from ape.utils import GeneratedDevAccount, cached_property
@@ -10,7 +13,7 @@ from ape_accounts import AccountContainer, KeyfileAccount
 from eth_account import Account as EthAccount
 from eth_account._utils.structured_data.hashing import hash_domain, hash_message
 from eth_account.messages import SignableMessage
-from eth_utils import to_bytes
+from eth_utils import to_bytes, to_checksum_address
 
 from ape_zksync.constants import ZKSYNC_TRANSACTION_STRUCT
 from ape_zksync.data import loads
@@ -74,11 +77,82 @@ class ZKSyncAccount(KeyfileAccount):
 
         return self.provider.send_transaction(txn)
 
+    def deploy(self, contract: ContractContainer, *args, **kwargs) -> ContractInstance:
+        # resolve factory deps from the compiled artifacts, unless given explicitly
+        compiler = self.compiler_manager.registered_compilers.get(".zkvy")
+        if compiler and "factory_deps" not in kwargs:
+            factory_deps = compiler.get_artifacts().get_factory_deps(  # type: ignore
+                contract.contract_type
+            )
+            if factory_deps:
+                kwargs["factory_deps"] = factory_deps
+
+        return AccountAPI.deploy(self, contract, *args, **kwargs)
+
+
+@lru_cache(maxsize=None)
+def _load_rich_wallets() -> Tuple[GeneratedDevAccount, ...]:
+    """Load the local node's pre-funded wallets once per process.
+
+    Addresses are checksummed up front so accounts never need to decode them again.
+    """
+    return tuple(
+        GeneratedDevAccount(to_checksum_address(acct["address"]), acct["privateKey"])
+        for acct in json.loads(loads("RichWallets.json"))
+    )
+
+
+def _worker_partition(wallets: Tuple[GeneratedDevAccount, ...]) -> List[GeneratedDevAccount]:
+    """Select the wallets owned by the current pytest-xdist worker.
+
+    Wallets are striped across workers by worker index, so parallel shards never share a
+    sender. Outside of xdist every wallet is returned. Workers beyond the number of wallets
+    get no wallets at all, see :func:`_worker_dev_accounts`.
+
+    :param wallets: All available wallets.
+    :returns: The subset of wallets assigned to this worker.
+    :rtype: List[GeneratedDevAccount]
+    """
+    worker_id = os.environ.get("PYTEST_XDIST_WORKER", "")
+    worker_count = int(os.environ.get("PYTEST_XDIST_WORKER_COUNT", 1))
+    if not worker_id.startswith("gw") or worker_count <= 1:
+        return list(wallets)
+
+    return list(wallets[int(worker_id[2:]) :: worker_count])
+
+
+def _worker_dev_accounts() -> List[GeneratedDevAccount]:
+    """The local node's pre-funded wallets owned by the current pytest-xdist worker.
+
+    :returns: The wallets assigned to this worker.
+    :rtype: List[GeneratedDevAccount]
+    :raises AccountsError: If there are more workers than wallets, and this worker got none.
+    """
+    dev_accounts = _worker_partition(_load_rich_wallets())
+    if not dev_accounts:
+        worker_count = os.environ.get("PYTEST_XDIST_WORKER_COUNT")
+        raise AccountsError(
+            f"Cannot partition {len(_load_rich_wallets())} test accounts across "
+            f"{worker_count} workers, run with fewer workers."
+        )
+    return dev_accounts
+
 
 class TestAccountContainer(TestAccountContainerAPI):
     @cached_property
     def _dev_accounts(self) -> List[GeneratedDevAccount]:
-        return [GeneratedDevAccount(*acct.values()) for acct in json.loads(loads("RichWallets.json"))]
+        return _worker_partition(_load_rich_wallets())
+
+    @cached_property
+    def _test_accounts(self) -> List["TestAccount"]:
+        return [
+            TestAccount(
+                index=index,
+                address_str=account.address,
+                private_key=account.private_key,
+            )
+            for index, account in enumerate(self._dev_accounts)
+        ]
 
     @property
     def aliases(self) -> Iterator[str]:
@@ -87,13 +161,7 @@ class TestAccountContainer(TestAccountContainerAPI):
 
     @property
     def accounts(self) -> Iterator["TestAccount"]:
-        for index in range(len(self)):
-            account = self._dev_accounts[index]
-            yield TestAccount(
-                index=index,
-                address_str=account.address,
-                private_key=account.private_key,
-            )
+        yield from self._test_accounts
 
     def __len__(self) -> int:
         return len(self._dev_accounts)
@@ -110,9 +178,11 @@ class TestAccount(TestAccountAPI):
 
     @property
     def address(self) -> AddressType:
-        return self.network_manager.get_ecosystem("zksync").decode_address(self.address_str)
+        # NOTE: `address_str` is checksummed when the wallets are loaded
+        return AddressType(self.address_str)
 
     call = ZKSyncAccount.call
+    deploy = ZKSyncAccount.deploy
 
     def sign_message(self, msg: SignableMessage) -> Optional[MessageSignature]:
         signed_msg = EthAccount.sign_message(msg, self.private_key)
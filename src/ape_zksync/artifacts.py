@@ -0,0 +1,209 @@
+import contextlib
+import json
+import os
+import sys
+import tempfile
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from ethpm_types import ContractType
+from hexbytes import HexBytes
+
+from ape_zksync.utils import hash_bytecode
+
+MANIFEST_FILENAME = "manifest.json"
+LOCK_FILENAME = ".lock"
+
+
+def artifact_key(source_id: str, name: str) -> str:
+    """Key of a contract in an :class:`ArtifactStore`.
+
+    :param str source_id: The contract source ID, relative to the contracts folder.
+    :param str name: The contract name.
+    :returns: The artifact key.
+    :rtype: str
+    """
+    return f"{source_id}:{name}"
+
+
+def _atomic_write(path: Path, data: bytes):
+    with tempfile.NamedTemporaryFile(dir=path.parent, suffix=".tmp", delete=False) as fp:
+        fp.write(data)
+    os.replace(fp.name, path)
+
+
+@contextlib.contextmanager
+def _file_lock(path: Path):
+    with path.open("a+b") as fp:
+        if sys.platform == "win32":
+            import msvcrt
+
+            fp.seek(0)
+            msvcrt.locking(fp.fileno(), msvcrt.LK_LOCK, 1)
+            try:
+                yield
+            finally:
+                fp.seek(0)
+                msvcrt.locking(fp.fileno(), msvcrt.LK_UNLCK, 1)
+        else:
+            import fcntl
+
+            fcntl.flock(fp.fileno(), fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(fp.fileno(), fcntl.LOCK_UN)
+
+
+class ArtifactStore:
+    """Compiled artifact store, used to resolve factory dependencies on deployment.
+
+    Each deployment bytecode is written once as a raw ``<bytecode hash>.bin`` blob next to a
+    small JSON manifest holding the bytecode hashes and the factory dependency graph. Blobs
+    are only read when a contract with factory dependencies is deployed.
+
+    :param Path path: The directory holding the manifest and blobs.
+    """
+
+    def __init__(self, path: Path):
+        self.path = path
+        self._manifest_cache: Dict[str, Dict] = {}
+        self._manifest_stat: Optional[Tuple[int, ...]] = None
+
+    def _stat_manifest(self) -> Optional[Tuple[int, ...]]:
+        manifest_path = self.path / MANIFEST_FILENAME
+        if not manifest_path.is_file():
+            return None
+        stat = manifest_path.stat()
+        return (stat.st_mtime_ns, stat.st_ino, stat.st_size)
+
+    def _reload(self):
+        manifest_path = self.path / MANIFEST_FILENAME
+        self._manifest_stat = self._stat_manifest()
+        self._manifest_cache = (
+            json.loads(manifest_path.read_text())["contracts"] if self._manifest_stat else {}
+        )
+
+    @property
+    def _manifest(self) -> Dict[str, Dict]:
+        # NOTE: reloaded whenever another process has saved the manifest
+        if self._stat_manifest() != self._manifest_stat:
+            self._reload()
+        return self._manifest_cache
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._manifest
+
+    def __iter__(self) -> Iterator[str]:
+        yield from self._manifest
+
+    @contextlib.contextmanager
+    def update(self):
+        """Modify the store while holding its lock.
+
+        :meth:`add`, :meth:`remove_source` and :meth:`prune` must be called within this
+        context. On exit the manifest is saved and blobs no contract references are deleted.
+        """
+        self.path.mkdir(parents=True, exist_ok=True)
+        with _file_lock(self.path / LOCK_FILENAME):
+            self._reload()
+            manifest = self._manifest_cache
+            try:
+                yield self
+            except BaseException:
+                # discard the unsaved changes
+                self._reload()
+                raise
+
+            _atomic_write(
+                self.path / MANIFEST_FILENAME,
+                json.dumps({"contracts": manifest}, sort_keys=True).encode(),
+            )
+            self._manifest_stat = self._stat_manifest()
+
+            referenced = {entry["bytecode"] for entry in manifest.values()}
+            for blob_path in self.path.glob("*.bin"):
+                if blob_path.stem not in referenced:
+                    blob_path.unlink()
+
+    def add(self, contract_type: ContractType, factory_deps: Optional[List[str]] = None):
+        """Add a compiled contract to the store.
+
+        :param ContractType contract_type: The compiled contract.
+        :param factory_deps: Keys of the contracts this contract deploys.
+        """
+        bytecode = HexBytes(contract_type.get_deployment_bytecode() or b"")
+        key = artifact_key(contract_type.source_id, contract_type.name)  # type: ignore
+        self._manifest[key] = {
+            "sourceId": contract_type.source_id,
+            "bytecode": self._write_blob(bytecode),
+            "factoryDeps": factory_deps or [],
+        }
+
+    def remove_source(self, source_id: str):
+        """Remove every contract compiled from a source.
+
+        :param str source_id: The source ID to remove.
+        """
+        manifest = self._manifest
+        for key in [k for k, v in manifest.items() if v["sourceId"] == source_id]:
+            del manifest[key]
+
+    def prune(self, base_path: Path):
+        """Remove contracts whose source no longer exists.
+
+        :param Path base_path: The folder source IDs are relative to.
+        """
+        for source_id in {v["sourceId"] for v in self._manifest.values()}:
+            if not (base_path / source_id).is_file():
+                self.remove_source(source_id)
+
+    def get_factory_deps(self, contract_type: ContractType) -> List[bytes]:
+        """Get the bytecode of all contracts a contract deploys, including transitive ones.
+
+        Nothing is returned unless the stored contract was compiled from the same bytecode,
+        and every dependency blob is intact.
+
+        :param ContractType contract_type: The contract to deploy.
+        :returns: The dependency bytecodes, in depth-first order without duplicates.
+        :rtype: List[bytes]
+        """
+        manifest = self._manifest
+        key = artifact_key(contract_type.source_id, contract_type.name)  # type: ignore
+        bytecode = HexBytes(contract_type.get_deployment_bytecode() or b"")
+        if key not in manifest or manifest[key]["bytecode"] != hash_bytecode(bytecode).hex():  # type: ignore
+            return []
+
+        deps: List[str] = []
+        stack = list(reversed(manifest[key]["factoryDeps"]))
+        while stack:
+            dep = stack.pop()
+            if dep in deps or dep == key:
+                continue
+            if dep not in manifest:
+                return []
+            deps.append(dep)
+            stack.extend(reversed(manifest[dep]["factoryDeps"]))
+
+        blobs = []
+        for dep in deps:
+            blob = self._read_blob(manifest[dep]["bytecode"])
+            if blob is None:
+                return []
+            blobs.append(blob)
+        return blobs
+
+    def _write_blob(self, bytecode: bytes) -> str:
+        # blobs are content addressed, identical bytecode is only stored once
+        blob = hash_bytecode(bytecode).hex()  # type: ignore
+        blob_path = self.path / f"{blob}.bin"
+        if not blob_path.is_file():
+            _atomic_write(blob_path, bytecode)
+        return blob
+
+    def _read_blob(self, blob: str) -> Optional[bytes]:
+        blob_path = self.path / f"{blob}.bin"
+        if not blob_path.is_file():
+            return None
+        bytecode = blob_path.read_bytes()
+        return bytecode if hash_bytecode(bytecode).hex() == blob else None  # type: ignore
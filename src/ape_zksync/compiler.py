@@ -2,13 +2,15 @@ import contextlib
 import re
 from collections import defaultdict
 from pathlib import Path
-from typing import Dict, List, Optional, Set
+from typing import Dict, List, Optional, Set, Tuple
 
 import zkvvm
 from ape.api import CompilerAPI
+from ape.utils import cached_property
 from ethpm_types import ContractType
 from semantic_version import SimpleSpec, Version
 
+from ape_zksync.artifacts import ArtifactStore, artifact_key
 from ape_zksync.config import ZKSyncConfig
 
 PATTERN = re.compile(r"\s* \# \s+ @zk-version \s+ (.+)", re.VERBOSE)
@@ -23,6 +25,21 @@ class ZKVyperCompiler(CompilerAPI):
     def config(self) -> ZKSyncConfig:
         return self.config_manager.get_config("zksync")
 
+    @cached_property
+    def _artifact_stores(self) -> Dict[Path, ArtifactStore]:
+        return {}
+
+    def get_artifacts(self) -> ArtifactStore:
+        """Get the artifact store of the active project.
+
+        :returns: The store kept in the project's ``.build/zksync`` folder.
+        :rtype: :class:`~ape_zksync.artifacts.ArtifactStore`
+        """
+        path = (self.project_manager.path / ".build" / "zksync").absolute()
+        if path not in self._artifact_stores:
+            self._artifact_stores[path] = ArtifactStore(path)
+        return self._artifact_stores[path]
+
     def get_versions(self, all_paths: List[Path]) -> Set[str]:
         versions = []
         with contextlib.ExitStack() as stack:
@@ -49,6 +66,8 @@ class ZKVyperCompiler(CompilerAPI):
             [p for p in contract_filepaths if p.parent.name != "interfaces"]
         )
 
+        # NOTE: maps source IDs to their compiled contracts and factory deps
+        artifacts: Dict[str, List[Tuple[ContractType, List[str]]]] = defaultdict(list)
         contracts = []
         for zk_version, source_paths in version_map.items():
             config["zk_version"] = SimpleSpec(str(zk_version))
@@ -68,7 +87,14 @@ class ZKVyperCompiler(CompilerAPI):
                 o["zk_version"] = str(zk_version)
                 o["vyper_version"] = self.config.vyper_version
 
-                contracts.append(ContractType.parse_obj(o))
+                contract_type = ContractType.parse_obj(o)
+                contracts.append(contract_type)
+
+                factory_deps = [
+                    artifact_key(src_id, name + suffix)
+                    for suffix in (o["factory_deps"] or {}).values()
+                ]
+                artifacts[src_id].append((contract_type, factory_deps))
 
                 if o["factory_deps"]:
                     for suffix in o["factory_deps"].values():
@@ -79,7 +105,19 @@ class ZKVyperCompiler(CompilerAPI):
                         contract["runtimeBytecode"] = {
                             "bytecode": output[suffix]["bytecode_runtime"]
                         }
-                        contracts.append(ContractType.parse_obj(contract))
+                        dep_type = ContractType.parse_obj(contract)
+                        contracts.append(dep_type)
+                        artifacts[src_id].append((dep_type, []))
+
+        # NOTE: only the active project's contracts are deployed with resolved factory deps
+        if Path(base_path).absolute() == Path(self.config_manager.contracts_folder).absolute():
+            with self.get_artifacts().update() as store:
+                for src_id, compiled in artifacts.items():
+                    store.remove_source(src_id)
+                    for contract_type, factory_deps in compiled:
+                        store.add(contract_type, factory_deps)
+                store.prune(base_path)
+
         return contracts
 
     def get_version_map(
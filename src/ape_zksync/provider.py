@@ -2,6 +2,7 @@ from ape.api import TransactionAPI, Web3Provider
 from ape.exceptions import TransactionError
 from web3 import HTTPProvider, Web3
 
+from ape_zksync.account import _worker_dev_accounts
 from ape_zksync.transaction import LegacyTransaction, TransactionType
 from ape_zksync.constants import CONTRACT_DEPLOYER
 
@@ -22,6 +23,10 @@ class ZKSyncProvider(Web3Provider):
         return self.web3.eth.gas_price
 
     def connect(self):
+        if self.network.name == "local":
+            # NOTE: raises if this xdist worker has no pre-funded wallet to send from
+            _worker_dev_accounts()
+
         self._web3 = Web3(HTTPProvider(self.uri))
 
     def disconnect(self):
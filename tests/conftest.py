@@ -0,0 +1,24 @@
+import pytest
+from ethpm_types import ContractType
+
+from ape_zksync.artifacts import ArtifactStore
+
+
+@pytest.fixture
+def make_contract_type():
+    def make_contract_type(name: str, bytecode: bytes, source_id: str = "Factory.zkvy"):
+        return ContractType.parse_obj(
+            {
+                "contractName": name,
+                "sourceId": source_id,
+                "deploymentBytecode": {"bytecode": "0x" + bytecode.hex()},
+                "runtimeBytecode": {"bytecode": "0x" + bytecode.hex()},
+            }
+        )
+
+    return make_contract_type
+
+
+@pytest.fixture
+def store(tmp_path):
+    return ArtifactStore(tmp_path / ".build" / "zksync")
@@ -0,0 +1,127 @@
+import pytest
+from ape.api import AccountAPI
+from ape.exceptions import AccountsError
+from ape.utils import GeneratedDevAccount
+
+from ape_zksync.account import (
+    TestAccount,
+    _load_rich_wallets,
+    _worker_dev_accounts,
+    _worker_partition,
+)
+from ape_zksync.artifacts import artifact_key
+from ape_zksync.provider import ZKSyncProvider
+
+WALLETS = tuple(GeneratedDevAccount(f"0x{i:040x}", f"0x{i:064x}") for i in range(10))
+
+
+@pytest.fixture(autouse=True)
+def clear_xdist_env(monkeypatch):
+    monkeypatch.delenv("PYTEST_XDIST_WORKER", raising=False)
+    monkeypatch.delenv("PYTEST_XDIST_WORKER_COUNT", raising=False)
+
+
+@pytest.mark.parametrize("worker_count", [2, 3, 4, 10, 16])
+def test_worker_partition_is_disjoint_and_complete(monkeypatch, worker_count):
+    monkeypatch.setenv("PYTEST_XDIST_WORKER_COUNT", str(worker_count))
+
+    partitions = []
+    for index in range(worker_count):
+        monkeypatch.setenv("PYTEST_XDIST_WORKER", f"gw{index}")
+        partitions.append(_worker_partition(WALLETS))
+
+    assigned = [wallet for partition in partitions for wallet in partition]
+    assert all(partitions[: len(WALLETS)])
+    assert len(assigned) == len(set(assigned))
+    assert set(assigned) == set(WALLETS)
+
+
+def test_worker_partition_outside_xdist():
+    assert _worker_partition(WALLETS) == list(WALLETS)
+
+
+def test_worker_partition_single_worker(monkeypatch):
+    monkeypatch.setenv("PYTEST_XDIST_WORKER", "gw0")
+    monkeypatch.setenv("PYTEST_XDIST_WORKER_COUNT", "1")
+
+    assert _worker_partition(WALLETS) == list(WALLETS)
+
+
+def test_worker_partition_too_many_workers(monkeypatch):
+    monkeypatch.setenv("PYTEST_XDIST_WORKER", f"gw{len(WALLETS)}")
+    monkeypatch.setenv("PYTEST_XDIST_WORKER_COUNT", str(len(WALLETS) + 1))
+
+    assert _worker_partition(WALLETS) == []
+
+
+def test_worker_dev_accounts_too_many_workers(monkeypatch):
+    wallet_count = len(_load_rich_wallets())
+    monkeypatch.setenv("PYTEST_XDIST_WORKER", f"gw{wallet_count}")
+    monkeypatch.setenv("PYTEST_XDIST_WORKER_COUNT", str(wallet_count + 1))
+
+    with pytest.raises(AccountsError):
+        _worker_dev_accounts()
+
+
+@pytest.mark.parametrize("network_name,raises", [("local", True), ("testnet", False)])
+def test_connect_too_many_workers(mocker, monkeypatch, network_name, raises):
+    wallet_count = len(_load_rich_wallets())
+    monkeypatch.setenv("PYTEST_XDIST_WORKER", f"gw{wallet_count}")
+    monkeypatch.setenv("PYTEST_XDIST_WORKER_COUNT", str(wallet_count + 1))
+    mocker.patch("ape_zksync.provider.Web3")
+    provider = mocker.MagicMock(network=mocker.MagicMock())
+    provider.network.name = network_name
+
+    if raises:
+        with pytest.raises(AccountsError):
+            ZKSyncProvider.connect(provider)
+    else:
+        ZKSyncProvider.connect(provider)
+
+
+@pytest.fixture
+def account(mocker, store):
+    compiler = mocker.MagicMock()
+    compiler.get_artifacts.return_value = store
+    compiler_manager = mocker.MagicMock(registered_compilers={".zkvy": compiler})
+    mocker.patch.object(TestAccount, "compiler_manager", compiler_manager)
+    dev_account = _load_rich_wallets()[0]
+    return TestAccount(
+        index=0, address_str=dev_account.address, private_key=dev_account.private_key
+    )
+
+
+@pytest.fixture
+def factory(store, make_contract_type):
+    factory = make_contract_type("Factory", bytes(64))
+    with store.update():
+        store.add(factory, [artifact_key("Factory.zkvy", "FactoryChild")])
+        store.add(make_contract_type("FactoryChild", bytes(32)))
+    return factory
+
+
+def test_deploy_factory_deps(mocker, account, factory):
+    deploy = mocker.patch.object(AccountAPI, "deploy")
+    contract = mocker.MagicMock(contract_type=factory)
+
+    account.deploy(contract, 1)
+
+    deploy.assert_called_once_with(account, contract, 1, factory_deps=[bytes(32)])
+
+
+def test_deploy_factory_deps_mismatched_bytecode(mocker, account, factory, make_contract_type):
+    deploy = mocker.patch.object(AccountAPI, "deploy")
+    contract = mocker.MagicMock(contract_type=make_contract_type("Factory", bytes(96)))
+
+    account.deploy(contract)
+
+    deploy.assert_called_once_with(account, contract)
+
+
+def test_deploy_explicit_factory_deps(mocker, account, factory):
+    deploy = mocker.patch.object(AccountAPI, "deploy")
+    contract = mocker.MagicMock(contract_type=factory)
+
+    account.deploy(contract, factory_deps=[])
+
+    deploy.assert_called_once_with(account, contract, factory_deps=[])
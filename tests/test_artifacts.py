@@ -0,0 +1,124 @@
+import pytest
+
+from ape_zksync.artifacts import ArtifactStore, artifact_key
+from ape_zksync.utils import hash_bytecode
+
+FACTORY = bytes(range(32)) * 4
+CHILD = bytes(reversed(range(32))) * 2
+GRANDCHILD = bytes(32)
+
+FACTORY_KEY = artifact_key("Factory.zkvy", "Factory")
+CHILD_KEY = artifact_key("Factory.zkvy", "FactoryChild")
+GRANDCHILD_KEY = artifact_key("Factory.zkvy", "FactoryGrandchild")
+
+
+def blob_names(store):
+    return {p.stem for p in store.path.glob("*.bin")}
+
+
+@pytest.fixture
+def contracts(make_contract_type):
+    return {
+        FACTORY_KEY: make_contract_type("Factory", FACTORY),
+        CHILD_KEY: make_contract_type("FactoryChild", CHILD),
+        GRANDCHILD_KEY: make_contract_type("FactoryGrandchild", GRANDCHILD),
+    }
+
+
+@pytest.fixture
+def populated_store(store, contracts):
+    with store.update():
+        store.add(contracts[FACTORY_KEY], [CHILD_KEY])
+        store.add(contracts[CHILD_KEY], [GRANDCHILD_KEY])
+        store.add(contracts[GRANDCHILD_KEY])
+    return store
+
+
+def test_factory_deps(populated_store, contracts):
+    assert populated_store.get_factory_deps(contracts[FACTORY_KEY]) == [CHILD, GRANDCHILD]
+    assert populated_store.get_factory_deps(contracts[CHILD_KEY]) == [GRANDCHILD]
+    assert populated_store.get_factory_deps(contracts[GRANDCHILD_KEY]) == []
+
+
+def test_factory_deps_shared_dependency(store, make_contract_type):
+    factory = make_contract_type("Factory", FACTORY)
+    with store.update():
+        store.add(factory, [CHILD_KEY, GRANDCHILD_KEY])
+        store.add(make_contract_type("FactoryChild", CHILD), [GRANDCHILD_KEY])
+        store.add(make_contract_type("FactoryGrandchild", GRANDCHILD))
+
+    assert store.get_factory_deps(factory) == [CHILD, GRANDCHILD]
+
+
+def test_factory_deps_mismatched_bytecode(populated_store, make_contract_type):
+    # e.g. a dependency's contract sharing a key with a local one, or a stale store
+    other = make_contract_type("Factory", FACTORY[::-1])
+
+    assert populated_store.get_factory_deps(other) == []
+
+
+def test_factory_deps_unknown_contract(populated_store, make_contract_type):
+    other = make_contract_type("Factory", FACTORY, source_id="Other.zkvy")
+
+    assert populated_store.get_factory_deps(other) == []
+
+
+def test_factory_deps_corrupt_blob(populated_store, contracts):
+    (populated_store.path / f"{hash_bytecode(GRANDCHILD).hex()}.bin").write_bytes(b"\x00")
+
+    assert populated_store.get_factory_deps(contracts[FACTORY_KEY]) == []
+
+
+def test_reload(populated_store, contracts):
+    reloaded = ArtifactStore(populated_store.path)
+
+    assert set(reloaded) == set(contracts)
+    assert reloaded.get_factory_deps(contracts[FACTORY_KEY]) == [CHILD, GRANDCHILD]
+
+
+def test_sees_changes_from_other_stores(populated_store):
+    other = ArtifactStore(populated_store.path)
+    with other.update():
+        other.remove_source("Factory.zkvy")
+
+    assert list(populated_store) == []
+
+
+def test_identical_bytecode_stored_once(store, make_contract_type):
+    with store.update():
+        store.add(make_contract_type("Factory", FACTORY))
+        store.add(make_contract_type("Other", FACTORY, source_id="Other.zkvy"))
+
+    assert blob_names(store) == {hash_bytecode(FACTORY).hex()}
+
+
+def test_update_deletes_unreferenced_blobs(populated_store, make_contract_type):
+    with populated_store.update():
+        populated_store.remove_source("Factory.zkvy")
+        populated_store.add(make_contract_type("Factory", CHILD))
+
+    assert blob_names(populated_store) == {hash_bytecode(CHILD).hex()}
+    assert not list(populated_store.path.glob("*.tmp"))
+
+
+def test_update_error_discards_changes(populated_store, contracts):
+    with pytest.raises(ValueError):
+        with populated_store.update():
+            populated_store.remove_source("Factory.zkvy")
+            raise ValueError()
+
+    assert set(populated_store) == set(contracts)
+
+
+def test_prune_removes_deleted_sources(tmp_path, store, make_contract_type):
+    contracts_folder = tmp_path / "contracts"
+    contracts_folder.mkdir()
+    (contracts_folder / "Factory.zkvy").touch()
+
+    with store.update():
+        store.add(make_contract_type("Factory", FACTORY))
+        store.add(make_contract_type("Deleted", CHILD, source_id="Deleted.zkvy"))
+        store.prune(contracts_folder)
+
+    assert list(store) == [FACTORY_KEY]
+    assert blob_names(store) == {hash_bytecode(FACTORY).hex()}
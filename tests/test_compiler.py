@@ -0,0 +1,116 @@
+import pytest
+from semantic_version import Version
+
+from ape_zksync.artifacts import artifact_key
+from ape_zksync.compiler import ZKVyperCompiler
+from ape_zksync.config import ZKSyncConfig
+
+FACTORY = bytes(range(32)) * 4
+CHILD = bytes(reversed(range(32))) * 2
+
+
+@pytest.fixture
+def project(tmp_path, mocker):
+    contracts_folder = tmp_path / "src" / "contracts"
+    contracts_folder.mkdir(parents=True)
+    config_manager = mocker.MagicMock(contracts_folder=contracts_folder)
+    config_manager.get_config.return_value = ZKSyncConfig()
+    mocker.patch.object(ZKVyperCompiler, "config_manager", config_manager)
+    mocker.patch.object(ZKVyperCompiler, "project_manager", mocker.MagicMock(path=tmp_path))
+    return contracts_folder
+
+
+@pytest.fixture
+def compiler():
+    return ZKVyperCompiler()
+
+
+@pytest.fixture
+def compile_output(mocker):
+    zkvvm = mocker.patch("ape_zksync.compiler.zkvvm")
+    mocker.patch.object(ZKVyperCompiler, "get_version_map")
+
+    def compile_output(compiler, output):
+        paths = {p for p in output if p.endswith(".zkvy")}
+        compiler.get_version_map.return_value = {Version("1.1.0"): paths}
+        zkvvm.VersionManager.return_value.compile.return_value = output
+
+    return compile_output
+
+
+def compiled(bytecode, factory_deps=None):
+    return {
+        "abi": [],
+        "bytecode": "0x" + bytecode.hex(),
+        "bytecode_runtime": "0x" + bytecode.hex(),
+        "factory_deps": factory_deps or {},
+    }
+
+
+def test_get_artifacts(tmp_path, project, compiler):
+    artifacts = compiler.get_artifacts()
+
+    assert artifacts.path == (tmp_path / ".build" / "zksync").absolute()
+    assert compiler.get_artifacts() is artifacts
+
+
+def test_compile_adds_factory_deps(project, compiler, compile_output):
+    source = project / "Factory.zkvy"
+    source.touch()
+    compile_output(
+        compiler,
+        {str(source): compiled(FACTORY, {"0x01": "Child"}), "Child": compiled(CHILD)},
+    )
+
+    contracts = {c.name: c for c in compiler.compile([source], project)}
+    artifacts = compiler.get_artifacts()
+
+    assert set(artifacts) == {
+        artifact_key("Factory.zkvy", "Factory"),
+        artifact_key("Factory.zkvy", "FactoryChild"),
+    }
+    assert artifacts.get_factory_deps(contracts["Factory"]) == [CHILD]
+
+
+def test_compile_replaces_source(project, compiler, compile_output):
+    source = project / "Factory.zkvy"
+    source.touch()
+    compile_output(
+        compiler,
+        {str(source): compiled(FACTORY, {"0x01": "Child"}), "Child": compiled(CHILD)},
+    )
+    compiler.compile([source], project)
+
+    compile_output(compiler, {str(source): compiled(CHILD)})
+    contract_type = compiler.compile([source], project)[0]
+    artifacts = compiler.get_artifacts()
+
+    assert list(artifacts) == [artifact_key("Factory.zkvy", "Factory")]
+    assert artifacts.get_factory_deps(contract_type) == []
+    assert len(list(artifacts.path.glob("*.bin"))) == 1
+
+
+def test_compile_prunes_deleted_sources(project, compiler, compile_output):
+    deleted, source = project / "Deleted.zkvy", project / "Factory.zkvy"
+    deleted.touch()
+    source.touch()
+    compile_output(compiler, {str(deleted): compiled(CHILD)})
+    compiler.compile([deleted], project)
+
+    deleted.unlink()
+    compile_output(compiler, {str(source): compiled(FACTORY)})
+    compiler.compile([source], project)
+
+    assert list(compiler.get_artifacts()) == [artifact_key("Factory.zkvy", "Factory")]
+
+
+def test_compile_other_project(tmp_path, project, compiler, compile_output):
+    contracts_folder = tmp_path / "dependency" / "contracts"
+    contracts_folder.mkdir(parents=True)
+    source = contracts_folder / "Factory.zkvy"
+    source.touch()
+    compile_output(compiler, {str(source): compiled(FACTORY)})
+
+    compiler.compile([source], contracts_folder)
+
+    assert list(compiler.get_artifacts()) == []